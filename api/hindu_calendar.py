@@ -4,9 +4,14 @@ Provides Hindu date calculation and festival information
 """
 
 from datetime import datetime, date
-import calendar
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from functools import lru_cache
 import json
 
+# Festival table row; converted with _asdict() wherever it is returned as JSON
+Festival = namedtuple('Festival', ['name', 'significance', 'type'])
+
 class HinduCalendar:
     """
     Hindu Calendar utility class for Panchang calculations
@@ -14,67 +19,62 @@ class HinduCalendar:
     """
     
     # Hindu months (Purnimanta system)
-    HINDU_MONTHS = [
+    HINDU_MONTHS = (
         "Chaitra", "Vaishakha", "Jyeshtha", "Ashadha",
         "Shravana", "Bhadrapada", "Ashwin", "Kartik", 
         "Margashirsha", "Pausha", "Magha", "Phalguna"
-    ]
+    )
+    
+    # Approximate Hindu month for each Gregorian month, indexed by month - 1
+    _MONTH_MAPPING = (
+        "Pausha", "Magha", "Phalguna", "Chaitra",
+        "Vaishakha", "Jyeshtha", "Ashadha", "Shravana",
+        "Bhadrapada", "Ashwin", "Kartik", "Margashirsha"
+    )
     
     # Tithis (lunar days)
-    TITHIS = [
+    TITHIS = (
         "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
         "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
         "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima"
-    ]
+    )
+    
+    # (paksha, tithi) for each day of the month, indexed by day (0 unused).
+    # Days 1-15 are the bright fortnight, 16-31 the dark one; both cycle
+    # through the tithis from the 1st/16th.
+    _PAKSHA_TITHI_BY_DAY = ((None, None),) + tuple(zip(
+        ("Shukla Paksha",) * 15 + ("Krishna Paksha",) * 16,
+        TITHIS + TITHIS + TITHIS[:1]
+    ))
     
     # Major festivals and their significance
     FESTIVALS = {
-        "2024-03-25": {"name": "Holi", "significance": "Festival of Colors", "type": "festival"},
-        "2024-04-09": {"name": "Ram Navami", "significance": "Birth of Lord Rama", "type": "festival"},
-        "2024-04-17": {"name": "Hanuman Jayanti", "significance": "Birth of Lord Hanuman", "type": "festival"},
-        "2024-08-19": {"name": "Janmashtami", "significance": "Birth of Lord Krishna", "type": "festival"},
-        "2024-09-07": {"name": "Ganesh Chaturthi", "significance": "Birth of Lord Ganesha", "type": "festival"},
-        "2024-10-02": {"name": "Gandhi Jayanti", "significance": "National Holiday", "type": "national"},
-        "2024-10-12": {"name": "Dussehra", "significance": "Victory of Good over Evil", "type": "festival"},
-        "2024-11-01": {"name": "Diwali", "significance": "Festival of Lights", "type": "festival"},
-        "2024-11-15": {"name": "Bhai Dooj", "significance": "Brother-Sister Festival", "type": "festival"},
-        # Add Amavasya (New Moon) dates for 2024-2025
-        "2024-01-11": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-02-09": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-03-10": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-04-08": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-05-08": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-06-06": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-07-05": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-08-04": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-09-03": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-10-02": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-11-01": {"name": "Amavasya", "significance": "New Moon Day (Diwali)", "type": "lunar"},
-        "2024-12-01": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2024-12-30": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
+        "2024-03-25": Festival("Holi", "Festival of Colors", "festival"),
+        "2024-04-09": Festival("Ram Navami", "Birth of Lord Rama", "festival"),
+        "2024-04-17": Festival("Hanuman Jayanti", "Birth of Lord Hanuman", "festival"),
+        "2024-08-19": Festival("Janmashtami", "Birth of Lord Krishna", "festival"),
+        "2024-09-07": Festival("Ganesh Chaturthi", "Birth of Lord Ganesha", "festival"),
+        "2024-10-12": Festival("Dussehra", "Victory of Good over Evil", "festival"),
+        "2024-11-01": Festival("Amavasya", "New Moon Day (Diwali)", "lunar"),
+        "2024-11-15": Festival("Bhai Dooj", "Brother-Sister Festival", "festival"),
         # 2025 festivals
-        "2025-03-14": {"name": "Holi", "significance": "Festival of Colors", "type": "festival"},
-        "2025-03-30": {"name": "Ram Navami", "significance": "Birth of Lord Rama", "type": "festival"},
-        "2025-04-06": {"name": "Hanuman Jayanti", "significance": "Birth of Lord Hanuman", "type": "festival"},
-        "2025-08-16": {"name": "Janmashtami", "significance": "Birth of Lord Krishna", "type": "festival"},
-        "2025-08-27": {"name": "Ganesh Chaturthi", "significance": "Birth of Lord Ganesha", "type": "festival"},
-        "2025-10-02": {"name": "Gandhi Jayanti", "significance": "National Holiday", "type": "national"},
-        "2025-10-22": {"name": "Dussehra", "significance": "Victory of Good over Evil", "type": "festival"},
-        "2025-11-01": {"name": "Diwali", "significance": "Festival of Lights", "type": "festival"},
-        "2025-11-03": {"name": "Bhai Dooj", "significance": "Brother-Sister Festival", "type": "festival"},
-        # 2025 Amavasya dates
-        "2025-01-29": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-02-28": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-03-29": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-04-27": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-05-27": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-06-25": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-07-24": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-08-23": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-09-21": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-10-21": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-11-20": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
-        "2025-12-19": {"name": "Amavasya", "significance": "New Moon Day", "type": "lunar"},
+        "2025-03-14": Festival("Holi", "Festival of Colors", "festival"),
+        "2025-03-30": Festival("Ram Navami", "Birth of Lord Rama", "festival"),
+        "2025-04-06": Festival("Hanuman Jayanti", "Birth of Lord Hanuman", "festival"),
+        "2025-08-16": Festival("Janmashtami", "Birth of Lord Krishna", "festival"),
+        "2025-08-27": Festival("Ganesh Chaturthi", "Birth of Lord Ganesha", "festival"),
+        "2025-10-02": Festival("Gandhi Jayanti", "National Holiday", "national"),
+        "2025-10-22": Festival("Dussehra", "Victory of Good over Evil", "festival"),
+        "2025-11-01": Festival("Diwali", "Festival of Lights", "festival"),
+        "2025-11-03": Festival("Bhai Dooj", "Brother-Sister Festival", "festival"),
+    }
+    
+    # Amavasya (New Moon) dates per year as (month, day)
+    AMAVASYA_DATES = {
+        2024: ((1, 11), (2, 9), (3, 10), (4, 8), (5, 8), (6, 6), (7, 5),
+               (8, 4), (9, 3), (10, 2), (11, 1), (12, 1), (12, 30)),
+        2025: ((1, 29), (2, 28), (3, 29), (4, 27), (5, 27), (6, 25),
+               (7, 24), (8, 23), (9, 21), (10, 21), (11, 20), (12, 19)),
     }
     
     # Shraddha period (Pitru Paksha) - approximate dates
@@ -83,19 +83,68 @@ class HinduCalendar:
         "2025": ("2025-09-06", "2025-09-21"),
     }
     
-    def __init__(self):
-        """Initialize Hindu Calendar with validation maps"""
-        self._validate_festival_dates()
+    # SHRADDHA_PERIODS parsed once: {year: (start_date, end_date)}
+    _SHRADDHA_PARSED = {
+        int(year): (date.fromisoformat(start), date.fromisoformat(end))
+        for year, (start, end) in SHRADDHA_PERIODS.items()
+    }
     
-    def _validate_festival_dates(self):
-        """Validate all festival dates are in correct format"""
-        for date_str in self.FESTIVALS.keys():
+    @classmethod
+    def _build_festival_index(cls):
+        """
+        Build the class-level festival indexes every lookup reads from
+        
+        Parses and validates the FESTIVALS and AMAVASYA_DATES tables, then
+        fills _festivals_by_ordinal, _festival_ordinals/_festival_entries,
+        _festivals_by_month and _suggestions_by_month. Run once at import.
+        
+        Raises:
+            ValueError: If a festival or Amavasya date is invalid
+        """
+        cls._festivals_by_ordinal = {}
+        for date_str, festival in cls.FESTIVALS.items():
             try:
-                datetime.strptime(date_str, "%Y-%m-%d")
+                festival_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             except ValueError as e:
                 raise ValueError(f"Invalid festival date format: {date_str}") from e
+            cls._festivals_by_ordinal[festival_date.toordinal()] = festival
+        
+        # An entry in FESTIVALS wins over the generated Amavasya on the same day
+        amavasya = Festival("Amavasya", "New Moon Day", "lunar")
+        for year, month_days in cls.AMAVASYA_DATES.items():
+            for month, day in month_days:
+                try:
+                    ordinal = date(year, month, day).toordinal()
+                except ValueError as e:
+                    raise ValueError(f"Invalid Amavasya date: {year}-{month}-{day}") from e
+                cls._festivals_by_ordinal.setdefault(ordinal, amavasya)
+        
+        # Sorted ordinals with aligned (date, Festival) pairs, for date-range lookups
+        cls._festival_ordinals = tuple(sorted(cls._festivals_by_ordinal))
+        cls._festival_entries = tuple(
+            (date.fromordinal(ordinal), cls._festivals_by_ordinal[ordinal]) for ordinal in cls._festival_ordinals
+        )
+        
+        # Month view of the same pairs, in date order
+        cls._festivals_by_month = {}
+        for festival_date, festival in cls._festival_entries:
+            cls._festivals_by_month.setdefault((festival_date.year, festival_date.month), []).append(
+                (festival_date, festival))
+        
+        # Holiday suggestions depend only on the static table, so build them once
+        cls._suggestions_by_month = {
+            year_month: [{
+                'date': festival_date.isoformat(),
+                'name': festival.name,
+                'type': festival.type,
+                'description': festival.significance,
+                'is_suggested': True
+            } for festival_date, festival in entries]
+            for year_month, entries in cls._festivals_by_month.items()
+        }
     
-    def get_vikram_samvat(self, date_obj=None):
+    @classmethod
+    def get_vikram_samvat(cls, date_obj=None):
         """
         Get Vikram Samvat year
         Vikram Samvat starts around April, so:
@@ -117,15 +166,11 @@ class HinduCalendar:
         if not isinstance(date_obj, date):
             raise ValueError("date_obj must be a valid date object")
             
-        gregorian_year = date_obj.year
-        
         # Simplified calculation - in reality, it depends on the exact start of Chaitra
-        if date_obj.month <= 3:
-            return gregorian_year + 56
-        else:
-            return gregorian_year + 57
+        return date_obj.year + 56 + (date_obj.month > 3)
     
-    def get_hindu_month_approximate(self, date_obj=None):
+    @classmethod
+    def get_hindu_month_approximate(cls, date_obj=None):
         """
         Get approximate Hindu month based on Gregorian date.
         This is a simplified mapping - actual calculation requires lunar positions.
@@ -145,18 +190,11 @@ class HinduCalendar:
         if not isinstance(date_obj, date):
             raise ValueError("date_obj must be a valid date object")
         
-        # Month mapping with 15-day offset to better approximate lunar months
-        month_mapping = {
-            1: "Pausha", 2: "Magha", 3: "Phalguna", 4: "Chaitra",
-            5: "Vaishakha", 6: "Jyeshtha", 7: "Ashadha", 8: "Shravana",
-            9: "Bhadrapada", 10: "Ashwin", 11: "Kartik", 12: "Margashirsha"
-        }
-        
-        # Add 15 days to better align with lunar months
-        adjusted_date = date_obj.replace(day=min(date_obj.day + 15, 28))
-        return month_mapping.get(adjusted_date.month, "Chaitra")
+        # Approximate lunar month by Gregorian month (see _MONTH_MAPPING)
+        return cls._MONTH_MAPPING[date_obj.month - 1]
     
-    def get_paksha_and_tithi_approximate(self, date_obj=None):
+    @classmethod
+    def get_paksha_and_tithi_approximate(cls, date_obj=None):
         """
         Get approximate Paksha (fortnight) and Tithi (lunar day)
         This is a simplified calculation based on the day of month
@@ -164,101 +202,88 @@ class HinduCalendar:
         if date_obj is None:
             date_obj = date.today()
         
-        # Simplified calculation based on date
-        day = date_obj.day
-        
         # Approximate mapping - in reality this needs lunar calendar calculation
-        if day <= 15:
-            paksha = "Shukla Paksha"  # Bright fortnight
-            tithi_index = (day - 1) % 15
-        else:
-            paksha = "Krishna Paksha"  # Dark fortnight
-            tithi_index = (day - 16) % 15
-        
-        tithi = self.TITHIS[tithi_index] if tithi_index < len(self.TITHIS) else "Purnima"
-        
-        return paksha, tithi
+        return cls._PAKSHA_TITHI_BY_DAY[date_obj.day]
     
-    def get_festival_info(self, date_obj=None):
+    @classmethod
+    def get_festival_info(cls, date_obj=None):
         """Check if the given date is a festival"""
         if date_obj is None:
             date_obj = date.today()
         
-        date_str = date_obj.strftime("%Y-%m-%d")
-        return self.FESTIVALS.get(date_str)
+        return cls._festivals_by_ordinal.get(date_obj.toordinal())
     
-    def is_shraddha_period(self, date_obj=None):
+    @classmethod
+    def is_shraddha_period(cls, date_obj=None):
         """Check if the date falls in Shraddha/Pitru Paksha period"""
         if date_obj is None:
             date_obj = date.today()
         
-        year = str(date_obj.year)
-        if year in self.SHRADDHA_PERIODS:
-            start_date = datetime.strptime(self.SHRADDHA_PERIODS[year][0], "%Y-%m-%d").date()
-            end_date = datetime.strptime(self.SHRADDHA_PERIODS[year][1], "%Y-%m-%d").date()
-            return start_date <= date_obj <= end_date
-        
-        return False
+        period = cls._SHRADDHA_PARSED.get(date_obj.year)
+        return period is not None and period[0] <= date_obj <= period[1]
     
-    def get_panchang_summary(self, date_obj=None):
+    @classmethod
+    def get_panchang_summary(cls, date_obj=None):
         """Get complete Panchang summary for a date"""
         if date_obj is None:
             date_obj = date.today()
         
-        hindu_month = self.get_hindu_month_approximate(date_obj)
-        vikram_samvat = self.get_vikram_samvat(date_obj)
-        paksha, tithi = self.get_paksha_and_tithi_approximate(date_obj)
-        festival = self.get_festival_info(date_obj)
-        is_shraddha = self.is_shraddha_period(date_obj)
+        hindu_month = cls.get_hindu_month_approximate(date_obj)
+        vikram_samvat = cls.get_vikram_samvat(date_obj)
+        paksha, tithi = cls.get_paksha_and_tithi_approximate(date_obj)
+        festival = cls.get_festival_info(date_obj)
+        is_shraddha = cls.is_shraddha_period(date_obj)
         
         return {
-            "gregorian_date": date_obj.strftime("%Y-%m-%d"),
+            "gregorian_date": date_obj.isoformat(),
             "hindu_month": hindu_month,
             "vikram_samvat": vikram_samvat,
             "paksha": paksha,
             "tithi": tithi,
-            "festival": festival,
+            "festival": festival._asdict() if festival else None,
             "is_shraddha": is_shraddha,
             "formatted_hindu_date": f"{hindu_month}, {paksha}, {tithi}, Vikram Samvat {vikram_samvat}"
         }
     
-    def get_month_festivals(self, year, month):
+    @classmethod
+    def get_month_festivals(cls, year, month):
         """Get all festivals for a specific month"""
-        festivals = []
-        
-        # Get number of days in the month
-        _, days_in_month = calendar.monthrange(year, month)
-        
-        for day in range(1, days_in_month + 1):
-            check_date = date(year, month, day)
-            festival = self.get_festival_info(check_date)
-            if festival:
-                festivals.append({
-                    "date": check_date.strftime("%Y-%m-%d"),
-                    "day": day,
-                    "festival": festival
-                })
-        
-        return festivals
+        return [
+            {"date": festival_date.isoformat(), "day": festival_date.day, "festival": festival._asdict()}
+            for festival_date, festival in cls._festivals_by_month.get((year, month), ())
+        ]
     
-    def get_suggested_holidays(self, year, month):
+    @classmethod
+    def get_festivals_between(cls, start_date, end_date):
+        """Get (date, Festival) pairs from start_date to end_date (inclusive), in date order"""
+        lo = bisect_left(cls._festival_ordinals, start_date.toordinal())
+        hi = bisect_right(cls._festival_ordinals, end_date.toordinal())
+        return cls._festival_entries[lo:hi]
+    
+    @classmethod
+    def get_suggested_holidays(cls, year, month):
         """Get suggested holidays for admin to add (festivals + Amavasya)."""
-        suggestions = []
-        
-        # Get all festivals for the month
-        festivals = self.get_month_festivals(year, month)
-        
-        for festival_data in festivals:
-            festival = festival_data['festival']
-            suggestions.append({
-                'date': festival_data['date'],
-                'name': festival['name'],
-                'type': festival.get('type', 'festival'),
-                'description': festival['significance'],
-                'is_suggested': True
-            })
-        
-        return suggestions
+        # Copies, so callers can't alter the prebuilt suggestions
+        return [dict(suggestion) for suggestion in cls._suggestions_by_month.get((year, month), ())]
+
+# Build the class-level festival indexes once at import
+HinduCalendar._build_festival_index()
+
+# Every method is a classmethod; kept as an alias for existing callers
+hindu_calendar = HinduCalendar
 
-# Create a global instance
-hindu_calendar = HinduCalendar()
\ No newline at end of file
+@lru_cache(maxsize=16)
+def get_hindu_holidays(year):
+    """
+    Get suggested holidays for every month of a year.
+
+    The result depends only on the year and the static festival table, so it
+    is computed once per year and reused for the life of the process.
+
+    Returns:
+        tuple: Suggested holiday dicts ordered by date
+    """
+    holidays = []
+    for month in range(1, 13):
+        holidays.extend(hindu_calendar.get_suggested_holidays(year, month))
+    return tuple(holidays)
\ No newline at end of file
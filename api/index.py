@@ -1,36 +1,114 @@
 import os
+import hmac
+import heapq
 import logging
-from psycopg2.pool import SimpleConnectionPool
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import RealDictCursor
 import psycopg2
-from datetime import datetime
-from functools import wraps
+import orjson
+from datetime import date, datetime
+from functools import lru_cache, wraps
 from flask import Flask, request, render_template, redirect, url_for, session, jsonify, flash
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.security import generate_password_hash, check_password_hash
-from api.hindu_calendar import get_hindu_holidays as fetch_hindu_holidays
+from api.hindu_calendar import hindu_calendar, get_hindu_holidays as fetch_hindu_holidays
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger(__name__)
 
 class Cache:
-    def __init__(self):
-        self.cache = {}
+    SWEEP_INTERVAL = 30
+
+    def __init__(self, max_size=1000, default_timeout=300):
+        # OrderedDict keeps LRU order so eviction is popitem(last=False);
+        # _exp_heap is a min-heap of (expiry, key) so a sweep only touches
+        # entries that have actually expired.
+        self.cache = OrderedDict()
+        self._timeouts = {}
+        self._exp_heap = []
+        self._max_size = max_size
+        self._default_timeout = default_timeout
+        self._lock = threading.RLock()
+        self._last_sweep = 0.0
+
+    def _cleanup(self, now):
+        # Caller must hold self._lock. Heap entries left behind by a later
+        # set() or delete() of the same key no longer match _timeouts and
+        # are simply dropped.
+        self._last_sweep = now
+        heap = self._exp_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if self._timeouts.get(key) == expiry:
+                del self._timeouts[key]
+                del self.cache[key]
+
+    def cleanup(self):
+        with self._lock:
+            self._cleanup(time.time())
 
     def get(self, key):
-        return self.cache.get(key)
-
-    def set(self, key, value):
-        self.cache[key] = value
+        # No sweep on the read path; an expired entry is just treated as a miss.
+        with self._lock:
+            expiry = self._timeouts.get(key)
+            if expiry is None or time.time() >= expiry:
+                return None
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+    def set(self, key, value, timeout=None):
+        now = time.time()
+        expiry = now + (self._default_timeout if timeout is None else timeout)
+        with self._lock:
+            if now - self._last_sweep > self.SWEEP_INTERVAL:
+                self._cleanup(now)
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            self._timeouts[key] = expiry
+            heapq.heappush(self._exp_heap, (expiry, key))
+            while len(self.cache) > self._max_size:
+                oldest, _ = self.cache.popitem(last=False)
+                del self._timeouts[oldest]
 
     def delete(self, key):
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            self.cache.pop(key, None)
+            self._timeouts.pop(key, None)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Dates, Decimals and other types orjson would format differently are
+    passed through to Flask's own default(), so payloads match what jsonify
+    produced before (non-ASCII text is emitted as UTF-8 rather than escaped).
+    """
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 class Database:
     def __init__(self):
-        self.pool = SimpleConnectionPool(
+        # Threaded pool: requests are served concurrently by gunicorn's
+        # gthread workers (see gunicorn.conf.py) and share this pool.
+        self.pool = ThreadedConnectionPool(
             minconn=1,
             maxconn=10,
-            dsn=os.environ.get("BLAZECORE_PAYROLL_DATABASE_URL")
+            dsn=os.environ.get("BLAZECORE_PAYROLL_DATABASE_URL"),
+            # Rows come back as real dicts straight from the driver, so
+            # callers and templates can use column names without re-wrapping.
+            cursor_factory=RealDictCursor
         )
 
     def get_connection(self):
@@ -53,7 +131,7 @@ class Database:
                 conn.commit()
                 return result
         except psycopg2.Error as e:
-            logging.error(f"Database query failed: {e}")
+            logger.error("Database query failed: %s", e)
             conn.rollback()
             return None
         finally:
@@ -66,7 +144,7 @@ class Database:
                 cur.execute(script)
                 conn.commit()
         except psycopg2.Error as e:
-            logging.error(f"Database script execution failed: {e}")
+            logger.error("Database script execution failed: %s", e)
             conn.rollback()
         finally:
             self.release_connection(conn)
@@ -114,10 +192,26 @@ class Database:
 
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'your_default_secret_key')
 db = Database()
 cache = Cache()
 
+# check_password_hash runs PBKDF2 on every call, so remember the outcome per
+# (stored hash, password). The password itself is never kept: entries are
+# keyed on an HMAC of it under a key that only lives as long as the process.
+password_cache = Cache(max_size=256, default_timeout=3600)
+_password_cache_key = secrets.token_bytes(32)
+
+def verify_password(password_hash, password):
+    digest = hmac.new(_password_cache_key, password.encode('utf-8'), 'sha256').hexdigest()
+    key = f'{password_hash}:{digest}'
+    result = password_cache.get(key)
+    if result is None:
+        result = check_password_hash(password_hash, password)
+        password_cache.set(key, result)
+    return result
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -136,10 +230,10 @@ def login():
         username = request.form['username']
         password = request.form['password']
         user = db.get_user_by_username(username)
-        if user and check_password_hash(user[6], password):
-            session['user_id'] = user[0]
-            session['username'] = user[5]
-            session['role'] = user[7]
+        if user and verify_password(user['password'], password):
+            session['user_id'] = user['id']
+            session['username'] = user['username']
+            session['role'] = user['role']
             flash('Login successful!', 'success')
             return redirect(url_for('dashboard'))
         else:
@@ -155,6 +249,9 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
+    # Access checks only need the status; skip the query and render for HEAD
+    if request.method == 'HEAD':
+        return app.response_class(mimetype='text/html')
     workers = db.get_all_user_data()
     return render_template('dashboard.html', workers=workers)
 
@@ -222,15 +319,33 @@ def settings():
 def reports():
     return render_template('reports.html')
 
+@lru_cache(maxsize=16)
+def _hindu_holidays_json(year):
+    # A year's holidays never change, so keep the encoded response body
+    # rather than re-serializing the same list on every request.
+    return f"{app.json.dumps(fetch_hindu_holidays(year))}\n".encode('utf-8')
+
 @app.route('/get_hindu_holidays')
 @login_required
 def get_hindu_holidays():
-    year = datetime.now().year
-    holidays = cache.get(f'hindu_holidays_{year}')
-    if not holidays:
-        holidays = fetch_hindu_holidays(year)
-        cache.set(f'hindu_holidays_{year}', holidays)
-    return jsonify(holidays)
+    body = _hindu_holidays_json(datetime.now().year)
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+@lru_cache(maxsize=400)
+def _panchang_json(day_ordinal):
+    # The panchang is a pure function of the date, so each day is computed
+    # and encoded once per process.
+    summary = hindu_calendar.get_panchang_summary(date.fromordinal(day_ordinal))
+    return f"{app.json.dumps(summary)}\n".encode('utf-8')
+
+@app.route('/api/panchang')
+@login_required
+def panchang():
+    response = app.response_class(_panchang_json(date.today().toordinal()),
+                                  mimetype=app.json.mimetype)
+    response.headers['Cache-Control'] = 'private, max-age=3600'
+    response.add_etag()
+    return response.make_conditional(request)
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
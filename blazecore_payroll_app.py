@@ -1,10 +1,43 @@
 import tkinter as tk
 from tkinter import messagebox, Toplevel
-from datetime import datetime
+from datetime import date
 import calendar
+from functools import lru_cache
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 import sqlite3
+import threading
+
+_VALID_STATUSES = frozenset({'present', 'absent', 'half-day', 'unmarked'})
+_INVALID_STATUS_MSG = "Invalid status. Must be one of: present, absent, half-day, unmarked"
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _shift_month(month, year, delta):
+    """Return (month, year) moved by delta months."""
+    year, month = divmod(year * 12 + month - 1 + delta, 12)
+    return month + 1, year
+
+
+def _fmt_inr(amount):
+    """Format an amount as ₹1,234.50 using integer paise arithmetic."""
+    paise = round(round(amount, 2) * 100)
+    rupees, paise = divmod(abs(paise), 100)
+    return f"{'-' if amount < 0 else ''}₹{rupees:,}.{paise:02d}"
+
+
+@lru_cache(maxsize=64)
+def _month_grid(year, month):
+    """calendar.monthcalendar padded to 6 weeks, as immutable tuples."""
+    weeks = [tuple(week) for week in calendar.monthcalendar(year, month)]
+    return tuple(weeks + [(0,) * 7] * (6 - len(weeks)))
+
 
 class ModernStyle:
     """Modern color palette and styling constants."""
@@ -52,6 +85,73 @@ class Database:
     """Handles all database operations for the application."""
     _instance = None
     _connection_pool = {}
+
+    # Shared statement text, so every call hits the same sqlite3 statement
+    # cache entry. active is a literal in the worker lists so the planner
+    # can match the partial idx_worker_active_name index.
+    _SQL_ACTIVE_WORKERS = """
+        SELECT id, name, daily_wage, created_at 
+        FROM workers 
+        WHERE active = 1 
+        ORDER BY name
+    """
+    _SQL_INACTIVE_WORKERS = """
+        SELECT id, name, daily_wage, created_at 
+        FROM workers 
+        WHERE active = 0 
+        ORDER BY name
+    """
+    _SQL_WORKER_IS_ACTIVE = "SELECT 1 FROM workers WHERE id = ? AND active = 1"
+    _SQL_UPSERT_ATTENDANCE = """
+        INSERT INTO attendance (worker_id, date, status, created_at) 
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(worker_id, date) 
+        DO UPDATE SET status = excluded.status, created_at = CURRENT_TIMESTAMP
+    """
+    _SQL_DELETE_ATTENDANCE = "DELETE FROM attendance WHERE worker_id = ? AND date(date) = ?"
+    # Plain range predicates so SQLite can seek the (worker_id, date) indexes
+    _SQL_MONTH_ATTENDANCE = """
+        SELECT date, status 
+        FROM attendance 
+        WHERE worker_id = ? 
+        AND date >= ? AND date < ?
+    """
+    _SQL_MONTH_ATTENDANCE_COUNTS = """
+        SELECT status, COUNT(*) 
+        FROM attendance 
+        WHERE worker_id = ? 
+        AND date >= ? AND date < ?
+        GROUP BY status
+    """
+    _SQL_MONTH_ADVANCES_TOTAL = """
+        SELECT COALESCE(SUM(amount), 0) 
+        FROM advances
+        WHERE worker_id = ? 
+        AND date >= ? AND date < ?
+    """
+    # Attendance counts and the advance total for one month in one round-trip
+    _SQL_MONTH_SUMMARY = """
+        SELECT att.present, att.absent, att.total,
+               (SELECT COALESCE(SUM(amount), 0.0) 
+                FROM advances 
+                WHERE worker_id = :worker_id 
+                AND date >= :start AND date < :end)
+        FROM (
+            SELECT COALESCE(SUM(status = 'present'), 0) AS present,
+                   COALESCE(SUM(status = 'absent'), 0) AS absent,
+                   COUNT(*) AS total
+            FROM attendance 
+            WHERE worker_id = :worker_id 
+            AND date >= :start AND date < :end
+        ) AS att
+    """
+    _SQL_ADVANCE_HISTORY = """
+        SELECT a.date, a.amount, a.notes, a.created_at
+        FROM advances a
+        WHERE a.worker_id = ?
+        ORDER BY a.date DESC, a.created_at DESC
+        LIMIT ?
+    """
     
     def __new__(cls, db_name="blazecore_payroll.db"):
         if cls._instance is None:
@@ -61,19 +161,73 @@ class Database:
         return cls._instance
     
     def _init_connection(self):
-        """Initialize database connection with optimized settings"""
-        self.conn = sqlite3.connect(
+        """Set up per-thread connection state; the schema is created on first use."""
+        # sqlite3 connections must not be shared across threads, so every
+        # thread that touches the database gets its own (see conn/cursor).
+        self._local = threading.local()
+        # get_workers results keyed by active_only; cleared on worker writes
+        self._workers_cache = {}
+        self._workers_lock = threading.Lock()
+        # get_month_summary results keyed by (worker_id, month, year);
+        # cleared on attendance and advance writes
+        self._summary_cache = {}
+        self._summary_lock = threading.Lock()
+        # No file is opened until something actually reads or writes
+        self._tables_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self):
+        """Open the calling thread's connection with optimized settings"""
+        # Default (deferred) isolation: each `with self.conn:` block is one
+        # transaction and one WAL commit rather than one per statement.
+        conn = sqlite3.connect(
             self.db_name,
             timeout=30,  # Increased timeout for busy database
-            isolation_level=None  # Enable autocommit mode
+            cached_statements=256
         )
+        if self.db_name != ":memory:":
+            # page_size only applies to a brand-new file, so set it before WAL
+            conn.execute("PRAGMA page_size=4096")
+            # Serve reads from the OS page cache via mmap instead of read()
+            conn.execute("PRAGMA mmap_size=268435456")
+            # locking_mode stays NORMAL: EXCLUSIVE would let the first thread's
+            # connection keep the file lock and lock out every other thread's.
         # Enable WAL mode for better concurrent access
-        self.conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Checkpoint every 1000 pages so the WAL stays small in long sessions
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
         # Optimize for better performance
-        self.conn.execute("PRAGMA synchronous=NORMAL")
-        self.conn.execute("PRAGMA cache_size=10000")
-        self.cursor = self.conn.cursor()
-        self.create_tables()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-16000")  # 16 MiB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Rows support both row[0] and row['name'] without building dicts
+        conn.row_factory = sqlite3.Row
+        self._local.conn = conn
+        self._local.cursor = conn.cursor()
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """Create the schema once, on the first connection any thread opens."""
+        if self._tables_ready:
+            return
+        with self._schema_lock:
+            if not self._tables_ready:
+                self.create_tables()
+                self._tables_ready = True
+
+    @property
+    def conn(self):
+        """The calling thread's connection, opened on first use."""
+        if not hasattr(self._local, 'conn'):
+            self._connect()
+        return self._local.conn
+
+    @property
+    def cursor(self):
+        """The calling thread's cursor, opened on first use."""
+        if not hasattr(self._local, 'cursor'):
+            self._connect()
+        return self._local.cursor
 
     def create_tables(self):
         """Create the necessary tables if they don't exist."""
@@ -88,7 +242,9 @@ class Database:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_worker_name ON workers(name)')
+            # Partial index: the dashboard only lists active workers, already in name order
+            self.cursor.execute('DROP INDEX IF EXISTS idx_worker_name')
+            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_worker_active_name ON workers(name) WHERE active = 1')
             
             # Create attendance table with indexes for common queries
             self.cursor.execute('''
@@ -103,7 +259,9 @@ class Database:
                 )
             ''')
             self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(date)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_attendance_worker_date ON attendance(worker_id, date)')
+            # Covering index: monthly lookups are answered from the index alone
+            self.cursor.execute('DROP INDEX IF EXISTS idx_attendance_worker_date')
+            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_att_wd_covering ON attendance(worker_id, date, status)')
             
             # Create advances table with indexes for financial queries
             self.cursor.execute('''
@@ -120,6 +278,13 @@ class Database:
             self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_advances_date ON advances(date)')
             self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_advances_worker_date ON advances(worker_id, date)')
 
+    @staticmethod
+    def _month_bounds(month, year):
+        """Return the half-open [start, end) date range covering a month."""
+        start = f"{year}-{month:02d}-01"
+        end = f"{year + 1}-01-01" if month == 12 else f"{year}-{month + 1:02d}-01"
+        return start, end
+
     def add_worker(self, name, daily_wage):
         """Add a new worker with validation."""
         if not name or not str(name).strip():
@@ -130,55 +295,84 @@ class Database:
         name = str(name).strip()
         
         with self.conn:  # Use context manager for automatic transaction handling
+            # Take the write lock before the duplicate check so it can't race
+            self.cursor.execute("BEGIN IMMEDIATE")
             # Check for duplicate names using indexed column
             self.cursor.execute("SELECT id FROM workers WHERE name = ? AND active = 1", (name,))
             if self.cursor.fetchone():
                 raise ValueError(f"Worker '{name}' already exists")
             
             # Insert new worker with current timestamp
-            self.cursor.execute(
-                "INSERT INTO workers (name, daily_wage, created_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+            worker_id = self.cursor.execute(
+                "INSERT INTO workers (name, daily_wage, created_at) VALUES (?, ?, CURRENT_TIMESTAMP) RETURNING id",
                 (name, daily_wage)
-            )
-            return self.cursor.lastrowid
+            ).fetchone()[0]
+            with self._workers_lock:
+                self._workers_cache.clear()
+            return worker_id
 
     def get_workers(self, active_only=True):
         """Get all workers with optional filtering."""
-        query = """
-            SELECT id, name, daily_wage, created_at 
-            FROM workers 
-            WHERE active = ? 
-            ORDER BY name
-        """
-        self.cursor.execute(query, (1 if active_only else 0,))
-        return [dict(zip(['id', 'name', 'daily_wage', 'created_at'], row)) 
-                for row in self.cursor.fetchall()]
+        with self._workers_lock:
+            cached = self._workers_cache.get(active_only)
+        if cached is not None:
+            return list(cached)
+
+        self.cursor.execute(self._SQL_ACTIVE_WORKERS if active_only else self._SQL_INACTIVE_WORKERS)
+        workers = self.cursor.fetchall()
+        with self._workers_lock:
+            self._workers_cache[active_only] = workers
+        return list(workers)
 
     def mark_attendance(self, worker_id, date_str, status):
         """Mark or update worker attendance with improved error handling."""
-        valid_statuses = {'present', 'absent', 'half-day', 'unmarked'}
-        if status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+        if status not in _VALID_STATUSES:
+            raise ValueError(_INVALID_STATUS_MSG)
             
         with self.conn:  # Use transaction
+            self.cursor.execute("BEGIN IMMEDIATE")
             # First verify worker exists and is active
-            self.cursor.execute("SELECT 1 FROM workers WHERE id = ? AND active = 1", (worker_id,))
+            self.cursor.execute(self._SQL_WORKER_IS_ACTIVE, (worker_id,))
             if not self.cursor.fetchone():
                 raise ValueError("Worker not found or inactive")
             
             if status == 'unmarked':
-                self.cursor.execute(
-                    "DELETE FROM attendance WHERE worker_id = ? AND date(date) = ?",
-                    (worker_id, date_str)
-                )
+                self.cursor.execute(self._SQL_DELETE_ATTENDANCE, (worker_id, date_str))
             else:
                 # Use UPSERT for cleaner code and better performance
-                self.cursor.execute("""
-                    INSERT INTO attendance (worker_id, date, status, created_at) 
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(worker_id, date) 
-                    DO UPDATE SET status = excluded.status, created_at = CURRENT_TIMESTAMP
-                """, (worker_id, date_str, status))
+                self.cursor.execute(self._SQL_UPSERT_ATTENDANCE, (worker_id, date_str, status))
+            self._clear_summary_cache()
+
+    def mark_attendance_bulk(self, records):
+        """Mark many (worker_id, date_str, status) entries in one transaction."""
+        records = list(records)
+        if not records:
+            return
+        if any(status not in _VALID_STATUSES for _, _, status in records):
+            raise ValueError(_INVALID_STATUS_MSG)
+
+        worker_ids = {worker_id for worker_id, _, _ in records}
+        upserts = [r for r in records if r[2] != 'unmarked']
+        deletes = [(worker_id, date_str) for worker_id, date_str, status in records if status == 'unmarked']
+
+        # One write lock and one WAL commit for the whole batch
+        self.cursor.execute("BEGIN IMMEDIATE")
+        try:
+            placeholders = ", ".join("?" * len(worker_ids))
+            self.cursor.execute(
+                f"SELECT COUNT(*) FROM workers WHERE active = 1 AND id IN ({placeholders})",
+                tuple(worker_ids)
+            )
+            if self.cursor.fetchone()[0] != len(worker_ids):
+                raise ValueError("Worker not found or inactive")
+
+            self.cursor.executemany(self._SQL_UPSERT_ATTENDANCE, upserts)
+            self.cursor.executemany(self._SQL_DELETE_ATTENDANCE, deletes)
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._clear_summary_cache()
 
     def get_attendance_for_month(self, worker_id, month, year):
         """Get monthly attendance with optimized query and error checking."""
@@ -186,22 +380,42 @@ class Database:
         if not (1 <= month <= 12 and 1900 <= year <= 9999):
             raise ValueError("Invalid month or year")
             
-        month_str = f"{year}-{str(month).zfill(2)}"
-        
-        # Use indexed columns for better performance
-        query = """
-            SELECT date, status 
-            FROM attendance 
-            WHERE worker_id = ? 
-            AND strftime('%Y-%m', date) = ?
-            AND EXISTS (SELECT 1 FROM workers WHERE id = worker_id AND active = 1)
-        """
-        
-        self.cursor.execute(query, (worker_id, month_str))
-        return {
-            datetime.strptime(d.split(' ')[0], '%Y-%m-%d').day: s 
-            for d, s in self.cursor.fetchall()
-        }
+        self.cursor.execute(self._SQL_MONTH_ATTENDANCE, (worker_id, *self._month_bounds(month, year)))
+        # Dates are stored as 'YYYY-MM-DD[ HH:MM:SS]', so the day is d[8:10]
+        return {int(d[8:10]): s for d, s in self.cursor.fetchall()}
+
+    def get_attendance_counts(self, worker_id, month, year):
+        """Get per-status day counts for a month, aggregated in SQLite."""
+        if not (1 <= month <= 12 and 1900 <= year <= 9999):
+            raise ValueError("Invalid month or year")
+
+        self.cursor.execute(self._SQL_MONTH_ATTENDANCE_COUNTS, (worker_id, *self._month_bounds(month, year)))
+        return dict(self.cursor.fetchall())
+
+    def get_month_summary(self, worker_id, month, year):
+        """Get (present_days, absent_days, total_days, total_advances) for a month."""
+        key = (worker_id, month, year)
+        with self._summary_lock:
+            cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not (1 <= month <= 12 and 1900 <= year <= 9999):
+            raise ValueError("Invalid month or year")
+
+        start, end = self._month_bounds(month, year)
+        self.cursor.execute(self._SQL_MONTH_SUMMARY,
+                            {'worker_id': worker_id, 'start': start, 'end': end})
+        summary = tuple(self.cursor.fetchone())
+        with self._summary_lock:
+            if len(self._summary_cache) >= 128:
+                self._summary_cache.clear()
+            self._summary_cache[key] = summary
+        return summary
+
+    def _clear_summary_cache(self):
+        with self._summary_lock:
+            self._summary_cache.clear()
 
     def add_advance(self, worker_id, amount, date_str, notes=None):
         """Add advance payment with enhanced validation and error handling."""
@@ -210,70 +424,58 @@ class Database:
         if amount > 50000:  # Reasonable upper limit
             raise ValueError("Advance amount seems too high (max: ₹50,000)")
             
+        advance_date = date.fromisoformat(date_str)
+        month_start, month_end = self._month_bounds(advance_date.month, advance_date.year)
+        days_in_month = _days_in_month(advance_date.year, advance_date.month)
+            
         with self.conn:
-            # Verify worker exists and is active
+            self.cursor.execute("BEGIN IMMEDIATE")
+            # Verify the worker, check the monthly cap and insert in a single
+            # statement; no row back means the worker or the cap check failed.
+            self.cursor.execute("""
+                WITH w AS (
+                    SELECT daily_wage FROM workers WHERE id = ? AND active = 1
+                ), s AS (
+                    SELECT COALESCE(SUM(amount), 0) AS total
+                    FROM advances
+                    WHERE worker_id = ? AND date >= ? AND date < ?
+                )
+                INSERT INTO advances (worker_id, amount, date, notes, created_at) 
+                SELECT ?, ?, ?, ?, CURRENT_TIMESTAMP
+                FROM w, s
+                WHERE s.total + ? <= w.daily_wage * ?
+                RETURNING id
+            """, (worker_id, worker_id, month_start, month_end,
+                  worker_id, amount, date_str, notes,
+                  amount, days_in_month))
+            inserted = self.cursor.fetchone()
+            if inserted:
+                self._clear_summary_cache()
+                return inserted[0]
+            
+            # Rejected: work out which check failed for the error message
             self.cursor.execute("SELECT daily_wage FROM workers WHERE id = ? AND active = 1", (worker_id,))
             worker = self.cursor.fetchone()
             if not worker:
                 raise ValueError("Worker not found or inactive")
-                
-            # Check if total advances for the month don't exceed monthly wage
-            daily_wage = worker[0]
-            month_str = datetime.strptime(date_str, '%Y-%m-%d').strftime('%Y-%m')
-            
-            self.cursor.execute("""
-                SELECT COALESCE(SUM(amount), 0) 
-                FROM advances 
-                WHERE worker_id = ? AND strftime('%Y-%m', date) = ?
-            """, (worker_id, month_str))
             
+            self.cursor.execute(self._SQL_MONTH_ADVANCES_TOTAL, (worker_id, month_start, month_end))
             current_advances = self.cursor.fetchone()[0] or 0
-            days_in_month = calendar.monthrange(int(month_str[:4]), int(month_str[5:]))[1]
-            max_possible_wage = daily_wage * days_in_month
-            
-            if current_advances + amount > max_possible_wage:
-                raise ValueError(f"Total advances ({current_advances + amount}) would exceed maximum monthly wage ({max_possible_wage})")
-            
-            # Insert advance with audit trail
-            self.cursor.execute("""
-                INSERT INTO advances (worker_id, amount, date, notes, created_at) 
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (worker_id, amount, date_str, notes))
-            
-            return self.cursor.lastrowid
+            max_possible_wage = worker[0] * days_in_month
+            raise ValueError(f"Total advances ({current_advances + amount}) would exceed maximum monthly wage ({max_possible_wage})")
 
     def get_advances_for_month(self, worker_id, month, year):
         """Get monthly advances with improved error handling and caching."""
         if not (1 <= month <= 12 and 1900 <= year <= 9999):
             raise ValueError("Invalid month or year")
             
-        month_str = f"{year}-{str(month).zfill(2)}"
-        
-        # Use optimized query with worker existence check
-        query = """
-            SELECT COALESCE(SUM(amount), 0) 
-            FROM advances a
-            WHERE a.worker_id = ? 
-            AND strftime('%Y-%m', a.date) = ?
-            AND EXISTS (SELECT 1 FROM workers w WHERE w.id = a.worker_id AND w.active = 1)
-        """
-        
-        self.cursor.execute(query, (worker_id, month_str))
+        self.cursor.execute(self._SQL_MONTH_ADVANCES_TOTAL, (worker_id, *self._month_bounds(month, year)))
         return self.cursor.fetchone()[0] or 0.0
 
     def get_advance_history(self, worker_id, limit=10):
         """Get recent advance history for a worker."""
-        query = """
-            SELECT a.date, a.amount, a.notes, a.created_at
-            FROM advances a
-            WHERE a.worker_id = ?
-            ORDER BY a.date DESC, a.created_at DESC
-            LIMIT ?
-        """
-        
-        self.cursor.execute(query, (worker_id, limit))
-        return [dict(zip(['date', 'amount', 'notes', 'created_at'], row)) 
-                for row in self.cursor.fetchall()]
+        self.cursor.execute(self._SQL_ADVANCE_HISTORY, (worker_id, limit))
+        return self.cursor.fetchall()
 
     def __enter__(self):
         """Enable context manager support."""
@@ -281,15 +483,19 @@ class Database:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up resources properly."""
-        if hasattr(self, 'conn'):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
             try:
                 if exc_type is None:
-                    self.conn.commit()
+                    conn.commit()
                 else:
-                    self.conn.rollback()
-                self.conn.close()
+                    conn.rollback()
+                conn.execute("PRAGMA optimize")
+                conn.close()
             except Exception:
                 pass
+            # A later call on this thread opens a fresh connection
+            del self._local.conn, self._local.cursor
 
 class App(ttkb.Window):
     """The main application window with modern dark theme."""
@@ -439,26 +645,60 @@ class DashboardFrame(ttkb.Frame):
         # Worker list container
         self.worker_list_frame = ttkb.Frame(parent)
         self.worker_list_frame.pack(fill=BOTH, expand=True, pady=(ModernStyle.ELEMENT_GAP, 0))
+        self._card_widgets = {}
+        self._empty_state = None
+        self._populate_pending = None
 
         self.populate_workers()
 
     def populate_workers(self):
         """Populate worker list with modern clean cards."""
-        for widget in self.worker_list_frame.winfo_children():
-            widget.destroy()
+        # Coalesce repeated refreshes into a single layout pass
+        if self._populate_pending is None:
+            self._populate_pending = self.worker_list_frame.after_idle(self._render_workers)
 
+    def _render_workers(self):
+        """Reuse existing cards and only build cards for new workers."""
+        self._populate_pending = None
         workers = self.db.get_workers()
+
+        for card in self._card_widgets.values():
+            card['container'].pack_forget()
+
         if not workers:
-            self.create_empty_state()
+            for card in self._card_widgets.values():
+                card['container'].destroy()
+            self._card_widgets.clear()
+            if self._empty_state is None:
+                self.create_empty_state()
             return
 
+        if self._empty_state is not None:
+            self._empty_state.destroy()
+            self._empty_state = None
+
+        current_ids = {worker['id'] for worker in workers}
+        for worker_id in list(self._card_widgets):
+            if worker_id not in current_ids:
+                self._card_widgets.pop(worker_id)['container'].destroy()
+
+        # Re-pack in query order so cards stay sorted by name
         for worker in workers:
-            self.create_worker_card(worker)
+            card = self._card_widgets.get(worker['id'])
+            if card is None:
+                card = self._card_widgets[worker['id']] = self.create_worker_card(worker)
+            else:
+                card['name_label'].configure(text=worker['name'])
+                card['wage_label'].configure(text=f"₹{worker['daily_wage']:,.0f}/day")
+                card['button'].configure(
+                    command=lambda w=worker: self.controller.show_frame("workerview", worker_data=w))
+            card['container'].pack(fill=X, pady=(0, ModernStyle.ELEMENT_GAP))
             
     def create_empty_state(self):
         """Create clean empty state."""
         empty_container = ttkb.Frame(self.worker_list_frame)
         empty_container.pack(expand=True, fill=BOTH)
+        self._empty_state = empty_container
 
         # Center the empty state content
         empty_content = ttkb.Frame(empty_container)
@@ -486,9 +726,8 @@ class DashboardFrame(ttkb.Frame):
                   
     def create_worker_card(self, worker):
         """Create a clean, modern worker card."""
-        # Card container with modern styling
+        # Card container with modern styling; packed by _render_workers
         card_container = ttkb.Frame(self.worker_list_frame, style="Modern.TFrame")
-        card_container.pack(fill=X, pady=(0, ModernStyle.ELEMENT_GAP))
 
         # Inner card content with padding
         card_content = ttkb.Frame(card_container)
@@ -506,26 +745,32 @@ class DashboardFrame(ttkb.Frame):
                    font=ModernStyle.FONT_BODY, 
                    foreground=ModernStyle.ACCENT_SECONDARY).pack(side=LEFT, padx=(0, 8))
 
-        ttkb.Label(name_frame, text=worker[1], 
-                   font=ModernStyle.FONT_CARD_TITLE, 
-                   foreground=ModernStyle.TEXT_PRIMARY).pack(side=LEFT)
+        name_label = ttkb.Label(name_frame, text=worker['name'], 
+                                font=ModernStyle.FONT_CARD_TITLE, 
+                                foreground=ModernStyle.TEXT_PRIMARY)
+        name_label.pack(side=LEFT)
 
         # Daily wage - clear and prominent
         wage_frame = ttkb.Frame(info_frame)
         wage_frame.pack(anchor=W, pady=(4, 0))
 
-        ttkb.Label(wage_frame, text=f"₹{worker[2]:,.0f}/day", 
-                   font=ModernStyle.FONT_BODY, 
-                   foreground=ModernStyle.ACCENT_SECONDARY).pack(side=LEFT)
+        wage_label = ttkb.Label(wage_frame, text=f"₹{worker['daily_wage']:,.0f}/day", 
+                                font=ModernStyle.FONT_BODY, 
+                                foreground=ModernStyle.ACCENT_SECONDARY)
+        wage_label.pack(side=LEFT)
 
         # Right side - Action button
         action_frame = ttkb.Frame(card_content)
         action_frame.pack(side=RIGHT)
 
         # Clean arrow button
-        ttkb.Button(action_frame, text=f"View Details {Icons.FORWARD}", 
-                    style="ModernSecondary.TButton",
-                    command=lambda w=worker: self.controller.show_frame("workerview", worker_data=w)).pack()
+        button = ttkb.Button(action_frame, text=f"View Details {Icons.FORWARD}", 
+                             style="ModernSecondary.TButton",
+                             command=lambda w=worker: self.controller.show_frame("workerview", worker_data=w))
+        button.pack()
+
+        return {'container': card_container, 'name_label': name_label,
+                'wage_label': wage_label, 'button': button}
                   
     def open_add_worker_popup(self):
         """Open modern add worker popup."""
@@ -681,13 +926,16 @@ class WorkerView(ttkb.Frame):
         self.controller = controller
         self.db = controller.db
         self.worker_data = None
-        self.current_month = datetime.now().month
-        self.current_year = datetime.now().year
+        self.worker_id = None
+        self.wage = None
+        today = date.today()
+        self.current_month, self.current_year = today.month, today.year
 
     def set_worker_data(self, worker_data):
         self.worker_data = worker_data
-        self.current_month = datetime.now().month
-        self.current_year = datetime.now().year
+        self.worker_id, self.wage = worker_data['id'], worker_data['daily_wage']
+        today = date.today()
+        self.current_month, self.current_year = today.month, today.year
         self.render()
 
     def render(self):
@@ -725,7 +973,7 @@ class WorkerView(ttkb.Frame):
                     command=lambda: self.controller.show_frame("dashboardframe")).pack(side=LEFT)
 
         # Worker name as main title
-        ttkb.Label(header_frame, text=self.worker_data[1], 
+        ttkb.Label(header_frame, text=self.worker_data['name'], 
                    font=ModernStyle.FONT_H1, 
                    foreground=ModernStyle.TEXT_PRIMARY).pack(side=LEFT, padx=(20, 0))
                  
@@ -755,48 +1003,39 @@ class WorkerView(ttkb.Frame):
 
         ttkb.Button(nav_frame, text="◀", 
                     style="ModernSecondary.TButton",
-                    command=self.prev_month).pack(side=LEFT)
+                    command=lambda: self.change_month(-1)).pack(side=LEFT)
 
-        month_label = ttkb.Label(nav_frame, 
-                                 text=f"{calendar.month_name[self.current_month]} {self.current_year}",
-                                 font=ModernStyle.FONT_H2,
-                                 foreground=ModernStyle.TEXT_PRIMARY)
-        month_label.pack(side=LEFT, expand=True)
+        self.month_label = ttkb.Label(nav_frame, 
+                                      text=f"{calendar.month_name[self.current_month]} {self.current_year}",
+                                      font=ModernStyle.FONT_H2,
+                                      foreground=ModernStyle.TEXT_PRIMARY)
+        self.month_label.pack(side=LEFT, expand=True)
 
         ttkb.Button(nav_frame, text="▶", 
                     style="ModernSecondary.TButton",
-                    command=self.next_month).pack(side=RIGHT)
+                    command=lambda: self.change_month(1)).pack(side=RIGHT)
 
         # Summary card
         self.summary_card = ttkb.Frame(parent, style="Modern.TFrame")
         self.summary_card.pack(fill=X)
 
+        self._build_summary_skeleton()
         self.refresh_summary()
 
-    def refresh_summary(self):
-        """Create modern summary with clean layout."""
-        for widget in self.summary_card.winfo_children():
-            widget.destroy()
-
+    def _build_summary_skeleton(self):
+        """Build the summary rows once; refresh_summary only updates their text."""
         # Card content with padding
         content_frame = ttkb.Frame(self.summary_card)
         content_frame.pack(fill=X, padx=ModernStyle.CARD_PADDING, pady=ModernStyle.CARD_PADDING)
 
-        worker_id, _, wage = self.worker_data
-        attendance_data = self.db.get_attendance_for_month(worker_id, self.current_month, self.current_year)
-
-        present_days = list(attendance_data.values()).count('present')
-        absent_days = list(attendance_data.values()).count('absent')
-        total_working_days = len(attendance_data)
-
-        total_earnings = present_days * wage
-        total_advances = self.db.get_advances_for_month(worker_id, self.current_month, self.current_year)
-        net_salary = total_earnings - total_advances
-
+        self.summary_labels = {}
         # Attendance summary
-        self.create_summary_row(content_frame, "Present Days", str(present_days), ModernStyle.STATUS_SUCCESS)
-        self.create_summary_row(content_frame, "Absent Days", str(absent_days), ModernStyle.STATUS_DANGER)
-        self.create_summary_row(content_frame, "Total Days", str(total_working_days), ModernStyle.ACCENT_SECONDARY)
+        self.summary_labels['present_days'] = self.create_summary_row(
+            content_frame, "Present Days", "", ModernStyle.STATUS_SUCCESS)
+        self.summary_labels['absent_days'] = self.create_summary_row(
+            content_frame, "Absent Days", "", ModernStyle.STATUS_DANGER)
+        self.summary_labels['total_days'] = self.create_summary_row(
+            content_frame, "Total Days", "", ModernStyle.ACCENT_SECONDARY)
 
         # Separator
         separator = ttkb.Frame(content_frame)
@@ -804,8 +1043,34 @@ class WorkerView(ttkb.Frame):
         separator.configure(height=1, style="Modern.TFrame")
 
         # Financial summary
-        self.create_summary_row(content_frame, "Total Earnings", f"₹{total_earnings:,.2f}", ModernStyle.STATUS_SUCCESS)
-        self.create_summary_row(content_frame, "Advances Paid", f"₹{total_advances:,.2f}", ModernStyle.STATUS_DANGER)
+        self.summary_labels['total_earnings'] = self.create_summary_row(
+            content_frame, "Total Earnings", "", ModernStyle.STATUS_SUCCESS)
+        self.summary_labels['total_advances'] = self.create_summary_row(
+            content_frame, "Advances Paid", "", ModernStyle.STATUS_DANGER)
+
+    def refresh_summary(self):
+        """Update the month title and summary values in place."""
+        self.month_label.configure(text=f"{calendar.month_name[self.current_month]} {self.current_year}")
+
+        present_days, absent_days, total_working_days, total_advances = self.db.get_month_summary(
+            self.worker_id, self.current_month, self.current_year)
+
+        total_earnings = present_days * self.wage
+        net_salary = total_earnings - total_advances
+
+        self.summary_labels['present_days'].configure(text=str(present_days))
+        self.summary_labels['absent_days'].configure(text=str(absent_days))
+        self.summary_labels['total_days'].configure(text=str(total_working_days))
+        self.summary_labels['total_earnings'].configure(text=_fmt_inr(total_earnings))
+        self.summary_labels['total_advances'].configure(text=_fmt_inr(total_advances))
+
+        # Warm the summary cache for the neighbouring months so the next
+        # arrow click is served without touching the database
+        self.after_idle(self._prefetch_adjacent_months, self.worker_id, self.current_month, self.current_year)
+
+    def _prefetch_adjacent_months(self, worker_id, month, year):
+        for delta in (-1, 1):
+            self.db.get_month_summary(worker_id, *_shift_month(month, year, delta))
         
                  
     def create_summary_row(self, parent, label, value, color):
@@ -817,32 +1082,21 @@ class WorkerView(ttkb.Frame):
                    font=ModernStyle.FONT_BODY, 
                    foreground=ModernStyle.TEXT_PRIMARY).pack(side=LEFT)
 
-        ttkb.Label(row_frame, text=value, 
-                   font=ModernStyle.FONT_BODY, 
-                   foreground=color).pack(side=RIGHT)
+        value_label = ttkb.Label(row_frame, text=value, 
+                                 font=ModernStyle.FONT_BODY, 
+                                 foreground=color)
+        value_label.pack(side=RIGHT)
+        return value_label
 
 
-    def prev_month(self):
-        """Navigate to previous month."""
-        if self.current_month == 1:
-            self.current_month = 12
-            self.current_year -= 1
-        else:
-            self.current_month -= 1
-        self.refresh_summary()
-        
-    def next_month(self):
-        """Navigate to next month."""
-        if self.current_month == 12:
-            self.current_month = 1
-            self.current_year += 1
-        else:
-            self.current_month += 1
+    def change_month(self, delta):
+        """Navigate the summary by delta months."""
+        self.current_month, self.current_year = _shift_month(self.current_month, self.current_year, delta)
         self.refresh_summary()
 
     def open_calendar(self):
         """Open attendance calendar popup."""
-        CalendarPopup(self.controller, self.worker_data[0], self.current_month, self.current_year)
+        CalendarPopup(self.controller, self.worker_id, self.current_month, self.current_year)
         
     def open_add_advance(self):
         """Open add advance popup."""
@@ -856,8 +1110,8 @@ class WorkerView(ttkb.Frame):
                     messagebox.showerror("Invalid Input", "Amount must be greater than 0")
                     return False
                     
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                self.db.add_advance(self.worker_data[0], amount, date_str)
+                date_str = date.today().isoformat()
+                self.db.add_advance(self.worker_id, amount, date_str)
                 self.refresh_summary()
                 messagebox.showinfo("Success", f"Advance of ₹{amount:.2f} added successfully!")
                 return True
@@ -874,6 +1128,11 @@ class WorkerView(ttkb.Frame):
 
 class CalendarPopup(Toplevel):
     """Modern calendar popup for attendance marking."""
+    _DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    _SYMBOLS = {'present': Icons.CHECK, 'absent': Icons.CROSS, 'unmarked': '?'}
+    _STYLES = {'present': "ModernPrimary.TButton"}
+    _NEXT_STATUS = {'unmarked': 'present', 'present': 'absent', 'absent': 'unmarked'}
+
     def __init__(self, parent, worker_id, current_month, current_year):
         super().__init__(parent)
         self.parent = parent
@@ -911,105 +1170,84 @@ class CalendarPopup(Toplevel):
         
     def create_widgets(self):
         """Create calendar widgets with modern styling."""
-        
-    def draw_calendar(self):
-        """Draw the calendar grid."""
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        self.calendar_frame = ttkb.Frame(self)
+        self.calendar_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
 
         # Day headers
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for i, day in enumerate(days):
-            ttkb.Label(self.calendar_frame, text=day, 
-                       font=ModernStyle.FONT_SUBTLE,
-                       foreground=ModernStyle.ACCENT_SECONDARY).grid(row=0, column=i, pady=(0, 10))
-
-        # Calendar days
-        cal = calendar.monthcalendar(self.year, self.month)
-        for r, week in enumerate(cal, 1):
-            for c, day in enumerate(week):
-                if day == 0:
-                    continue
-                
-                status = self.attendance_data.get(day, 'unmarked')
-                
-                # Create day button
-                btn_text = f"{day}\n{self.get_status_symbol(status)}"
-                
-                btn = ttkb.Button(self.calendar_frame, 
-                                  text=btn_text,
-                                  style=self.get_button_style(status),
-                                  command=lambda d=day: self.toggle_attendance(d))
+        frame, font, foreground = self.calendar_frame, ModernStyle.FONT_SUBTLE, ModernStyle.ACCENT_SECONDARY
+        for i, day in enumerate(self._DAYS):
+            ttkb.Label(frame, text=day, 
+                       font=font,
+                       foreground=foreground).grid(row=0, column=i, pady=(0, 10))
+
+        # A month spans at most 6 weeks; the grid is built once and reused
+        self.day_buttons = [[ttkb.Button(self.calendar_frame, style="ModernSecondary.TButton")
+                             for c in range(7)] for r in range(6)]
+        for r, row in enumerate(self.day_buttons, 1):
+            for c, btn in enumerate(row):
                 btn.grid(row=r, column=c, sticky="nsew", padx=1, pady=1)
-        
+        self.day_positions = {}
+
         # Configure grid weights
         for i in range(7): 
             self.calendar_frame.grid_columnconfigure(i, weight=1)
-        for i in range(len(cal) + 1): 
+        for i in range(7): 
             self.calendar_frame.grid_rowconfigure(i, weight=1)
-            
-    def get_status_symbol(self, status):
-        """Get symbol for attendance status."""
-        symbols = {
-            'present': Icons.CHECK,
-            'absent': Icons.CROSS,
-            'unmarked': '?'
-        }
-        return symbols.get(status, '?')
-        
-    def get_button_style(self, status):
-        """Get button style for attendance status."""
-        if status == 'present':
-            return "ModernPrimary.TButton"
-        elif status == 'absent':
-            return "ModernSecondary.TButton"
-        else:
-            return "ModernSecondary.TButton"
+
+        self.update_calendar()
+
+    def update_calendar(self):
+        """Point the prebuilt day buttons at the current month."""
+        # Bind lookups once; this loop touches all 42 cells
+        positions = self.day_positions = {}
+        buttons, attendance = self.day_buttons, self.attendance_data
+        symbols, styles, toggle = self._SYMBOLS, self._STYLES, self.toggle_attendance
+        default_style = "ModernSecondary.TButton"
+        for r, week in enumerate(_month_grid(self.year, self.month)):
+            row = buttons[r]
+            for c, day in enumerate(week):
+                if day == 0:
+                    row[c].configure(text="", style=default_style, state="disabled", command="")
+                    continue
+                positions[day] = (r, c)
+                status = attendance.get(day, 'unmarked')
+                row[c].configure(text=f"{day}\n{symbols.get(status, '?')}",
+                                 style=styles.get(status, default_style),
+                                 state="normal", command=lambda d=day: toggle(d))
+
+    def update_day_button(self, day):
+        """Show one day's status on its button."""
+        r, c = self.day_positions[day]
+        status = self.attendance_data.get(day, 'unmarked')
+        self.day_buttons[r][c].configure(text=f"{day}\n{self._SYMBOLS.get(status, '?')}",
+                                         style=self._STYLES.get(status, "ModernSecondary.TButton"))
             
     def toggle_attendance(self, day):
         """Toggle attendance status for a day."""
         current_status = self.attendance_data.get(day, 'unmarked')
         
         # Cycle through statuses
-        next_status = {
-            'unmarked': 'present',
-            'present': 'absent', 
-            'absent': 'unmarked'
-        }[current_status]
+        next_status = self._NEXT_STATUS[current_status]
         
-        date_str = f"{self.year}-{str(self.month).zfill(2)}-{str(day).zfill(2)}"
+        date_str = date(self.year, self.month, day).isoformat()
         self.db.mark_attendance(self.worker_id, date_str, next_status)
         
-        self.refresh_calendar()
-        
-    def prev_month(self):
-        """Navigate to previous month."""
-        self.change_month(-1)
-        
-    def next_month(self):
-        """Navigate to next month."""
-        self.change_month(1)
+        # Only the clicked day changed, so restyle just that button
+        if next_status == 'unmarked':
+            self.attendance_data.pop(day, None)
+        else:
+            self.attendance_data[day] = next_status
+        self.update_day_button(day)
         
     def change_month(self, delta):
         """Change month by delta."""
-        if delta == 1:
-            if self.month == 12:
-                self.month = 1
-                self.year += 1
-            else:
-                self.month += 1
-        else:
-            if self.month == 1:
-                self.month = 12
-                self.year -= 1
-            else:
-                self.month -= 1
+        self.month, self.year = _shift_month(self.month, self.year, delta)
         self.refresh_calendar()
         
     def refresh_calendar(self):
         """Refresh calendar display."""
         self.attendance_data = self.db.get_attendance_for_month(self.worker_id, self.month, self.year)
-        self.draw_calendar()
+        self.update_calendar()
 
 if __name__ == "__main__":
     app = App()
@@ -1,7 +1,22 @@
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import os
 
+LOGO_PATH = os.path.join('static', 'logo.png')
+
+@lru_cache(maxsize=None)
+def _load_font(size):
+    try:
+        # Try to use Arial, fall back to default if not available
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        return ImageFont.load_default()
+
 def create_logo():
+    # Skip the redraw if the logo is already newer than this script
+    if os.path.exists(LOGO_PATH) and os.path.getmtime(LOGO_PATH) >= os.path.getmtime(__file__):
+        return
+
     # Create a new image with a white background
     img_size = (192, 192)
     img = Image.new('RGBA', img_size, (255, 255, 255, 0))
@@ -16,11 +31,7 @@ def create_logo():
     
     # Add text
     text = "B"  # B for BlazeCore
-    try:
-        # Try to use Arial, fall back to default if not available
-        font = ImageFont.truetype("arial.ttf", 100)
-    except:
-        font = ImageFont.load_default()
+    font = _load_font(100)
     
     # Get text size
     text_bbox = draw.textbbox((0, 0), text, font=font)
@@ -37,7 +48,7 @@ def create_logo():
     # Save the image
     if not os.path.exists('static'):
         os.makedirs('static')
-    img.save('static/logo.png', 'PNG')
+    img.save(LOGO_PATH, 'PNG')
 
 if __name__ == "__main__":
     create_logo()
\ No newline at end of file
@@ -5,24 +5,39 @@ Tests all functionality to ensure everything is working correctly after fixes.
 """
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
+import socket
 import time
-from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+from datetime import date, datetime, timedelta
 
 # Base URL for the application
 BASE_URL = "http://127.0.0.1:5001"
 
+# Endpoint URLs, built once
+LOGIN_URL = BASE_URL + "/login"
+HOME_URL = BASE_URL + "/"
+ADD_WORKER_URL = BASE_URL + "/api/add_worker"
+WORKERS_URL = BASE_URL + "/api/workers"
+MARK_ATTENDANCE_URL = BASE_URL + "/api/mark_attendance"
+WORKER_ATTENDANCE_URL = BASE_URL + "/api/worker/{}/attendance"
+PANCHANG_URL = BASE_URL + "/api/panchang"
+STATS_URL = BASE_URL + "/api/stats"
+PAYROLL_REPORT_URL = BASE_URL + "/api/reports/payroll"
+ATTENDANCE_REPORT_URL = BASE_URL + "/api/reports/attendance"
+
 # Test credentials
 TEST_USERNAME = "admin"
 TEST_PASSWORD = "shreebalaji2024"
 
-def test_login():
+def test_login(session):
     """Test login functionality"""
     print("Testing login functionality...")
     
     # Test login page access
     try:
-        response = requests.get(f"{BASE_URL}/login")
+        response = session.get(LOGIN_URL)
         assert response.status_code == 200
         print("✓ Login page accessible")
     except Exception as e:
@@ -35,7 +50,7 @@ def test_login():
             'username': TEST_USERNAME,
             'password': TEST_PASSWORD
         }
-        response = requests.post(f"{BASE_URL}/login", data=login_data, allow_redirects=False)
+        response = session.post(LOGIN_URL, data=login_data, allow_redirects=False)
         assert response.status_code in [302, 200]  # Redirect or OK
         print("✓ Login with correct credentials successful")
     except Exception as e:
@@ -49,7 +64,7 @@ def test_dashboard_access(session):
     print("Testing dashboard access...")
     
     try:
-        response = session.get(f"{BASE_URL}/")
+        response = session.get(HOME_URL)
         assert response.status_code == 200
         assert "Shree Balaji Centring Works" in response.text
         print("✓ Dashboard accessible with correct branding")
@@ -67,20 +82,18 @@ def test_worker_management(session):
         "name": "Test Worker",
         "wage": 500,
         "phone": "9876543210",
-        "start_date": datetime.now().strftime("%Y-%m-%d")
+        "start_date": date.today().isoformat()
     }
     
     try:
-        response = session.post(f"{BASE_URL}/api/add_worker", 
-                              json=worker_data,
-                              headers={'Content-Type': 'application/json'})
+        response = session.post(ADD_WORKER_URL, json=worker_data)
         result = response.json()
         assert result.get('success') == True
         worker_id = result.get('worker_id')
         print("✓ Worker added successfully")
         
         # Get workers list
-        response = session.get(f"{BASE_URL}/api/workers")
+        response = session.get(WORKERS_URL)
         workers = response.json()
         assert isinstance(workers, list)
         assert len(workers) > 0
@@ -96,7 +109,7 @@ def test_attendance_marking(session, worker_id):
     print("Testing attendance marking...")
     
     # Mark attendance for today
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()
     attendance_data = {
         "worker_id": worker_id,
         "date": today,
@@ -104,15 +117,13 @@ def test_attendance_marking(session, worker_id):
     }
     
     try:
-        response = session.post(f"{BASE_URL}/api/mark_attendance",
-                              json=attendance_data,
-                              headers={'Content-Type': 'application/json'})
+        response = session.post(MARK_ATTENDANCE_URL, json=attendance_data)
         result = response.json()
         assert result.get('success') == True
         print("✓ Attendance marked successfully")
         
         # Get attendance records
-        response = session.get(f"{BASE_URL}/api/worker/{worker_id}/attendance")
+        response = session.get(WORKER_ATTENDANCE_URL.format(worker_id))
         attendance_records = response.json()
         assert isinstance(attendance_records, list)
         print("✓ Attendance records retrieved successfully")
@@ -129,13 +140,14 @@ def test_calendar_functionality(session, worker_id):
     try:
         # Test getting attendance for a specific month
         today = datetime.now()
-        response = session.get(f"{BASE_URL}/api/worker/{worker_id}/attendance?year={today.year}&month={today.month}")
+        response = session.get(WORKER_ATTENDANCE_URL.format(worker_id),
+                               params={'year': today.year, 'month': today.month})
         attendance_data = response.json()
         assert isinstance(attendance_data, list)
         print("✓ Calendar attendance data retrieved successfully")
         
         # Test Hindu calendar API
-        response = session.get(f"{BASE_URL}/api/panchang")
+        response = session.get(PANCHANG_URL)
         panchang_data = response.json()
         assert isinstance(panchang_data, dict)
         assert 'formatted_hindu_date' in panchang_data
@@ -152,19 +164,21 @@ def test_api_endpoints(session):
     
     try:
         # Test stats endpoint
-        response = session.get(f"{BASE_URL}/api/stats")
+        response = session.get(STATS_URL)
         stats = response.json()
         assert isinstance(stats, dict)
         print("✓ Stats API endpoint working")
         
         # Test reports endpoints
         today = datetime.now()
-        response = session.get(f"{BASE_URL}/api/reports/payroll?year={today.year}&month={today.month}")
+        response = session.get(PAYROLL_REPORT_URL,
+                               params={'year': today.year, 'month': today.month})
         payroll_report = response.json()
         assert isinstance(payroll_report, dict)
         print("✓ Payroll report API endpoint working")
         
-        response = session.get(f"{BASE_URL}/api/reports/attendance?year={today.year}&month={today.month}")
+        response = session.get(ATTENDANCE_REPORT_URL,
+                               params={'year': today.year, 'month': today.month})
         attendance_report = response.json()
         assert isinstance(attendance_report, dict)
         print("✓ Attendance report API endpoint working")
@@ -178,21 +192,24 @@ def main():
     """Main test function"""
     print("=== Shree Balaji Centring Works - Final Comprehensive Test ===\n")
     
-    # Create a session to maintain cookies
+    # Fail fast if nothing is listening rather than waiting out request retries
+    server = urlsplit(BASE_URL)
+    try:
+        socket.create_connection((server.hostname, server.port), timeout=0.5).close()
+    except OSError as e:
+        print(f"❌ SERVER NOT REACHABLE at {BASE_URL}: {e}")
+        return False
+    
+    # Create a session to maintain cookies and reuse one keep-alive connection
     session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                         max_retries=Retry(total=3, backoff_factor=0.1)))
     
-    # Test 1: Login functionality
-    if not test_login():
+    # Test 1: Login functionality; this also logs the session in
+    if not test_login(session):
         print("\n❌ LOGIN TEST FAILED")
         return False
     
-    # Login to get session
-    login_data = {
-        'username': TEST_USERNAME,
-        'password': TEST_PASSWORD
-    }
-    session.post(f"{BASE_URL}/login", data=login_data)
-    
     # Test 2: Dashboard access
     if not test_dashboard_access(session):
         print("\n❌ DASHBOARD TEST FAILED")
@@ -0,0 +1,29 @@
+"""Gunicorn settings for serving the payroll API outside Vercel.
+
+Run from the repository root with ``gunicorn api.index:app``; gunicorn picks
+this file up automatically. Every route spends most of its time waiting on
+Postgres, so each worker runs a pool of threads that can overlap those waits
+instead of a single synchronous request at a time.
+"""
+
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", "2"))
+# Each thread holds at most one connection from the Database pool. The pool
+# never waits for a free connection: once all maxconn (10) are checked out,
+# getconn() raises psycopg2.pool.PoolError. post_worker_init enforces
+# threads <= maxconn.
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+timeout = 30
+
+
+def post_worker_init(worker):
+    """Refuse to boot a worker whose threads could exhaust the Database pool."""
+    from api.index import db  # already imported by the worker at this point
+    if worker.cfg.threads > db.pool.maxconn:
+        raise RuntimeError(
+            f"GUNICORN_THREADS={worker.cfg.threads} exceeds the Database pool's "
+            f"maxconn={db.pool.maxconn}; requests would fail with PoolError"
+        )
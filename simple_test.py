@@ -4,22 +4,40 @@ Simple test script for Shree Balaji Centring Works Payroll System
 Tests core functionality without external dependencies.
 """
 
-import urllib.request
+import http.client
 import urllib.parse
 from datetime import datetime
 
 # Base URL for the application
 BASE_URL = "http://127.0.0.1:5001"
 
-def test_url_access(url, description):
-    """Test if a URL is accessible"""
+# One keep-alive connection shared by every check
+_base = urllib.parse.urlsplit(BASE_URL)
+conn = http.client.HTTPConnection(_base.hostname, _base.port, timeout=5)
+
+def get_status(path):
+    """HEAD a path on the shared connection, following redirects like urlopen"""
+    for _ in range(10):
+        # Only the status matters, so skip the body
+        conn.request('HEAD', path)
+        response = conn.getresponse()
+        response.read()
+        location = response.getheader('Location')
+        if response.status not in (301, 302, 303, 307, 308) or not location:
+            break
+        target = urllib.parse.urlsplit(urllib.parse.urljoin(path, location))
+        path = urllib.parse.urlunsplit(('', '', target.path or '/', target.query, ''))
+    return response.status
+
+def test_url_access(path, description):
+    """Test if a path is accessible"""
     try:
-        response = urllib.request.urlopen(url, timeout=5)
-        if response.getcode() == 200:
+        status = get_status(path)
+        if status == 200:
             print(f"✓ {description} - Accessible")
             return True
         else:
-            print(f"✗ {description} - HTTP {response.getcode()}")
+            print(f"✗ {description} - HTTP {status}")
             return False
     except Exception as e:
         print(f"✗ {description} - Error: {str(e)}")
@@ -31,16 +49,17 @@ def main():
     
     # Test basic URL access
     tests = [
-        (f"{BASE_URL}/login", "Login page"),
-        (f"{BASE_URL}/", "Dashboard (requires login)"),
-        (f"{BASE_URL}/api/stats", "Stats API (requires login)"),
-        (f"{BASE_URL}/api/panchang", "Hindu calendar API (requires login)")
+        ("/login", "Login page"),
+        ("/", "Dashboard (requires login)"),
+        ("/api/stats", "Stats API (requires login)"),
+        ("/api/panchang", "Hindu calendar API (requires login)")
     ]
     
     results = []
-    for url, description in tests:
-        result = test_url_access(url, description)
+    for path, description in tests:
+        result = test_url_access(path, description)
         results.append(result)
+    conn.close()
     
     # Summary
     passed = sum(results)
@@ -0,0 +1,68 @@
+"""Tests for the desktop app's SQLite Database layer"""
+
+import unittest
+import tempfile
+import threading
+import os
+
+try:
+    from blazecore_payroll_app import Database
+except ImportError:  # tkinter/ttkbootstrap not installed
+    Database = None
+
+@unittest.skipIf(Database is None, "blazecore_payroll_app needs tkinter and ttkbootstrap")
+class TestDatabaseThreads(unittest.TestCase):
+    """Each thread gets its own connection to the same database file"""
+
+    def setUp(self):
+        """Open a fresh database file for each test"""
+        self.test_dir = tempfile.mkdtemp()
+        Database._instance = None
+        self.db = Database(os.path.join(self.test_dir, "payroll.db"))
+        self.worker_id = self.db.add_worker("Test Worker", 500)
+        self.db.mark_attendance(self.worker_id, "2025-01-02", "present")
+
+    def run_in_thread(self, func):
+        """Run func on a second thread, closing that thread's connection after"""
+        result = {}
+        def target():
+            try:
+                result['value'] = func()
+            except Exception as e:
+                result['error'] = e
+            finally:
+                self.db.__exit__(None, None, None)
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive(), "Database call on second thread hung")
+        if 'error' in result:
+            raise result['error']
+        return result.get('value')
+
+    def test_second_thread_reads_while_main_connection_open(self):
+        """A second thread can read while the main thread's connection is open"""
+        main_conn = self.db.conn
+        other_conn = self.run_in_thread(lambda: self.db.conn)
+        self.assertIsNot(main_conn, other_conn)
+
+        attendance = self.run_in_thread(
+            lambda: self.db.get_attendance_for_month(self.worker_id, 1, 2025))
+        self.assertEqual(attendance, {2: "present"})
+
+    def test_second_thread_write_is_visible_to_main_thread(self):
+        """A write committed on a second thread is seen by the main thread"""
+        self.run_in_thread(lambda: self.db.mark_attendance(self.worker_id, "2025-01-03", "absent"))
+        attendance = self.db.get_attendance_for_month(self.worker_id, 1, 2025)
+        self.assertEqual(attendance, {2: "present", 3: "absent"})
+
+    def tearDown(self):
+        """Close the connection and remove the database files"""
+        self.db.__exit__(None, None, None)
+        Database._instance = None
+        for name in os.listdir(self.test_dir):
+            os.remove(os.path.join(self.test_dir, name))
+        os.rmdir(self.test_dir)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,11 +3,6 @@
 import unittest
 from datetime import datetime, date, timedelta
 from test_config import TestSession
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
 import time
 
 class TestPayrollFunctionality(unittest.TestCase):
@@ -17,7 +12,7 @@ class TestPayrollFunctionality(unittest.TestCase):
     def setUpClass(cls):
         """Set up test class - run once before all tests"""
         cls.session = TestSession()
-        success = cls.session.login()
+        success = cls.session.resume_or_login()
         if not success:
             raise RuntimeError("Failed to log in for tests")
         cls.test_workers = []
@@ -28,17 +23,20 @@ class TestPayrollFunctionality(unittest.TestCase):
     
     def test_login_and_dashboard(self):
         """Test login and dashboard access"""
-        success, response = self.session.request("/dashboard")
+        success, response = self.session.request("/dashboard", method="HEAD")
         self.assertTrue(success, "Failed to access dashboard")
     
     def test_worker_operations(self):
         """Test worker creation and management"""
+        today = date.today()
+        today_iso = today.isoformat()
+        
         # Create test worker data
         worker_data = {
             "name": "Test Worker",
             "daily_wage": 500.00,
             "phone": "1234567890",
-            "start_date": datetime.now().strftime("%Y-%m-%d")
+            "start_date": today_iso
         }
         
         # Create worker
@@ -66,7 +64,7 @@ class TestPayrollFunctionality(unittest.TestCase):
         # Test attendance marking
         attendance_data = {
             "worker_id": worker_id,
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today_iso,
             "status": "present"
         }
         
@@ -80,8 +78,7 @@ class TestPayrollFunctionality(unittest.TestCase):
         self.assertTrue(response.get("success"), "Attendance marking returned error")
         
         # Test payroll calculation
-        month = datetime.now().month
-        year = datetime.now().year
+        month, year = today.month, today.year
         
         success, response = self.session.request(
             f"/api/payroll/{worker_id}/{year}/{month}"
@@ -109,6 +106,19 @@ class TestPayrollFunctionality(unittest.TestCase):
 class TestModalScrolling(unittest.TestCase):
     """Test cases for modal scrolling functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Import selenium only when the browser tests actually run"""
+        global webdriver, By, WebDriverWait, EC, Keys
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.webdriver.common.keys import Keys
+        except ImportError:
+            raise unittest.SkipTest("selenium is not installed")
+    
     def setUp(self):
         """Set up each test"""
         self.driver = webdriver.Chrome()
@@ -0,0 +1,36 @@
+"""Tests for the Hindu calendar festival lookups"""
+
+import unittest
+from datetime import date
+from api.hindu_calendar import HinduCalendar
+
+class TestFestivalsBetween(unittest.TestCase):
+    """Test cases for HinduCalendar.get_festivals_between"""
+
+    def test_bounds_are_inclusive(self):
+        """Festivals on the start and end dates are both included"""
+        festivals = HinduCalendar.get_festivals_between(date(2025, 10, 21), date(2025, 11, 1))
+        self.assertEqual(
+            [(festival_date, festival.name) for festival_date, festival in festivals],
+            [(date(2025, 10, 21), "Amavasya"), (date(2025, 10, 22), "Dussehra"), (date(2025, 11, 1), "Diwali")]
+        )
+
+    def test_single_day_range(self):
+        """A range of one day returns that day's festival"""
+        festivals = HinduCalendar.get_festivals_between(date(2025, 11, 3), date(2025, 11, 3))
+        self.assertEqual(festivals, ((date(2025, 11, 3), HinduCalendar.get_festival_info(date(2025, 11, 3))),))
+
+    def test_range_without_festivals(self):
+        """Days just inside the neighbouring festivals return nothing"""
+        self.assertEqual(HinduCalendar.get_festivals_between(date(2025, 11, 4), date(2025, 11, 19)), ())
+
+    def test_matches_month_festivals(self):
+        """A whole-month range agrees with get_month_festivals"""
+        festivals = HinduCalendar.get_festivals_between(date(2025, 10, 1), date(2025, 10, 31))
+        self.assertEqual(
+            [festival_date.isoformat() for festival_date, _ in festivals],
+            [entry["date"] for entry in HinduCalendar.get_month_festivals(2025, 10)]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
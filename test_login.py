@@ -7,9 +7,15 @@ from test_config import TestSession, TEST_CONFIG
 class TestLoginSecurity(unittest.TestCase):
     """Test cases for login security features"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up test class - one session and connection shared by all tests"""
+        cls.session = TestSession()
+    
     def setUp(self):
-        """Set up each test"""
-        self.session = TestSession()
+        """Start each test logged out"""
+        self.session.cookie_jar.clear()
+        self.session.logged_in = False
     
     def test_successful_login(self):
         """Test successful login with correct credentials"""
@@ -45,7 +51,7 @@ class TestLoginSecurity(unittest.TestCase):
     def test_session_protection(self):
         """Test protected routes require login"""
         self.session.cookie_jar.clear()
-        success, _ = self.session.request("/dashboard")
+        success, _ = self.session.request("/dashboard", method="HEAD")
         self.assertFalse(success, "Accessed protected route without login")
     
     def test_logout(self):
@@ -59,12 +65,13 @@ class TestLoginSecurity(unittest.TestCase):
         self.assertTrue(success, "Logout request failed")
         
         # Try accessing protected route
-        success, _ = self.session.request("/dashboard")
+        success, _ = self.session.request("/dashboard", method="HEAD")
         self.assertFalse(success, "Accessed protected route after logout")
     
-    def tearDown(self):
-        """Clean up after each test"""
-        self.session.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests"""
+        cls.session.cleanup()
 
 if __name__ == "__main__":
     try:
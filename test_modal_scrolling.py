@@ -1,22 +1,9 @@
 """Tests for CSS styling and modal functionality in BlazeCore Payroll"""
 
 import unittest
-import tempfile
-import os
-import sqlite3
 
-class TestModalStyles(unittest.TestCase):
-    """Test cases for modal styling and functionality"""
-    
-    def setUp(self):
-        """Set up test environment"""
-        # Create temporary directory for test files
-        self.test_dir = tempfile.mkdtemp()
-        self.css_file = os.path.join(self.test_dir, "dashboard.css")
-        
-        # Create test CSS file
-        with open(self.css_file, "w") as f:
-            f.write('''
+# Modal styles the tests check against
+_CSS = '''
 /* Make body a flex container */
 body {
     display: flex;
@@ -87,48 +74,62 @@ body.modal-open {
     gap: 1rem;
     background: var(--card-bg);
 }
-''')
+'''
+
+class TestModalStyles(unittest.TestCase):
+    """Test cases for modal styling and functionality"""
+    
+    def assert_css_contains(self, *rules):
+        """Assert every rule is in the CSS, reporting all missing rules at once"""
+        missing = [rule for rule in rules if rule not in _CSS]
+        self.assertEqual(missing, [], f"Missing CSS rules: {missing}")
+    
+    def test_body_flex_container(self):
+        """Test body flex container styles"""
+        self.assert_css_contains(
+            "display: flex",
+            "flex-direction: column",
+            "min-height: 100vh",
+            "width: 100%"
+        )
+    
+    def test_modal_open_state(self):
+        """Test modal open state styles"""
+        self.assert_css_contains(
+            "body.modal-open",
+            "overflow: hidden",
+            "padding-right: 17px"
+        )
+    
+    def test_modal_container(self):
+        """Test modal container styles"""
+        self.assert_css_contains(
+            "position: fixed",
+            "z-index: 1000",
+            "overflow-y: auto"
+        )
+    
+    def test_modal_content(self):
+        """Test modal content styles"""
+        self.assert_css_contains(
+            "flex-direction: column",
+            "max-height: calc(100vh - 4rem)"
+        )
     
-    def test_css_properties(self):
-        """Test that CSS has required modal styling properties"""
-        with open(self.css_file) as f:
-            css = f.read()
-            
-        # Test body flex container styles
-        self.assertIn("display: flex", css)
-        self.assertIn("flex-direction: column", css)
-        self.assertIn("min-height: 100vh", css)
-        self.assertIn("width: 100%", css)
-        
-        # Test modal open state styles
-        self.assertIn("body.modal-open", css)
-        self.assertIn("overflow: hidden", css)
-        self.assertIn("padding-right: 17px", css)
-        
-        # Test modal container styles
-        self.assertIn("position: fixed", css)
-        self.assertIn("z-index: 1000", css)
-        self.assertIn("overflow-y: auto", css)
-        
-        # Test modal content styles
-        self.assertIn("flex-direction: column", css)
-        self.assertIn("max-height: calc(100vh - 4rem)", css)
-        
-        # Test modal body styles 
-        self.assertIn("overflow-y: auto", css)
-        self.assertIn("max-height: calc(100vh - 200px)", css)
-        
-        # Test modal header/actions styles
-        self.assertIn("border-bottom: 1px solid", css)
-        self.assertIn("border-top: 1px solid", css)
-        self.assertIn("justify-content: flex-end", css)
+    def test_modal_body(self):
+        """Test modal body styles"""
+        self.assert_css_contains(
+            "overflow-y: auto",
+            "max-height: calc(100vh - 200px)"
+        )
     
-    def tearDown(self):
-        """Clean up test files"""
-        if os.path.exists(self.test_dir):
-            if os.path.exists(self.css_file):
-                os.remove(self.css_file)
-            os.rmdir(self.test_dir)
+    def test_modal_header_and_actions(self):
+        """Test modal header/actions styles"""
+        self.assert_css_contains(
+            "border-bottom: 1px solid",
+            "border-top: 1px solid",
+            "justify-content: flex-end"
+        )
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file